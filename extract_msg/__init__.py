@@ -27,8 +27,8 @@ https://github.com/mattgwwalker/msg-extractor
 #    along with this program.  If not, see <http://www.gnu.org/licenses/>.
 
 __author__ = 'Destiny Peterson & Matthew Walker'
-__date__ = '2022-01-31'
-__version__ = '0.30.8'
+__date__ = '2026-10-15'
+__version__ = '0.30.9'
 
 import logging
 
@@ -38,6 +38,32 @@ RE_RTF_ENC_BODY_UGLY = re.compile(br'<body[^>]*>[^}]*?\}')
 RE_RTF_BODY_FALLBACK_FS = re.compile(br'\\fs[0-9]*[^a-zA-Z]')
 RE_RTF_BODY_FALLBACK_F = re.compile(br'\\f[0-9]*[^a-zA-Z]')
 RE_RTF_FALLBACK_PLAIN = re.compile(br'\\plain[^a-zA-Z0-9]')
+# Regular expression to find the control word that marks RTF as containing
+# encapsulated HTML or plain text. This has to be in the RTF header, which ends
+# at the first group.
+RE_RTF_ENCAPSULATED_TYPE = re.compile(br'\\from(html1|text)(?![a-zA-Z0-9])')
+# Regular expression to find the keywords that start each clause of a Received
+# header field.
+RE_RECEIVED_KEYWORDS = re.compile(r'(?<!\S)(from|by|via|with|id|for)(?=\s)', re.I)
+# Regular expression to find the address literal of a host in a Received header
+# field, which is in square brackets. Checking that it is actually a valid
+# address is left to the ipaddress module.
+RE_RECEIVED_IP = re.compile(r'\[(?:IPv6:)?([0-9A-Fa-f:.]+)\]')
+# Regular expression to find runs of whitespace in header fields. Collapsing
+# these to a single space also unfolds folded (multiline) fields, as a fold is
+# just a line break followed by more whitespace.
+RE_HEADER_WHITESPACE = re.compile(r'[ \t\r\n]+')
+# Regular expression that matches the start of a header when every line before
+# the blank line that ends it is a plain field or a continuation of one. If the
+# match does not reach that blank line (or the end of the text) there is
+# something unusual in the header that only the full email parser can handle.
+RE_HEADER_SIMPLE = re.compile(r'(?:[!-9;-~]+:[^\r\n]*(?:\r?\n[ \t][^\r\n]*)*(?:\r?\n|\Z))*')
+# The most commonly requested header fields, which can be found without parsing
+# the entire header.
+HEADER_QUICK_FIELD_NAMES = ('message-id', 'from', 'to', 'cc', 'bcc', 'date', 'subject')
+# Regular expression to pull the quick fields out of a header. The value
+# includes any continuation lines.
+RE_HEADER_QUICK_FIELDS = re.compile(r'^(' + '|'.join(HEADER_QUICK_FIELD_NAMES) + r'):[ \t]*(.*(?:\n[ \t].*)*)', re.I | re.M)
 
 
 # Constants used by named.py
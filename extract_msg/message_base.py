@@ -1,8 +1,9 @@
 import base64
+import collections
+import email.message
 import email.utils
 import logging
 import os
-import re
 
 import bs4
 import compressed_rtf
@@ -13,7 +14,7 @@ from .attachment import Attachment, BrokenAttachment, UnsupportedAttachment
 from .exceptions import UnrecognizedMSGTypeError
 from .msg import MSGFile
 from .recipient import Recipient
-from .utils import addNumToDir, inputToBytes, inputToString, prepareFilename
+from .utils import addNumToDir, cachedProperty, inputToBytes, inputToString, parseReceived, prepareFilename
 from email.parser import Parser as EmailParser
 from imapclient.imapclient import decode_utf7
 
@@ -21,6 +22,66 @@ logger = logging.getLogger(__name__)
 logger.addHandler(logging.NullHandler())
 
 
+class _LazyHeader(email.message.Message):
+    """
+    The `email.message.Message` for the header of a message, which only runs
+    the full email parser when something other than one of the common fields
+    is requested. The state inherited from `email.message.Message` is filled in
+    from the parser the first time it is needed.
+    """
+    def __init__(self, headerText : str):
+        # The parent's state is only set once the header is parsed, so its
+        # __init__ is not called here.
+        self.__headerText = headerText
+        self.__added = []
+        self.__isParsed = False
+        self.__quickFields = None
+        # The quick fields can only be trusted if the header is simple enough
+        # that they are guaranteed to match what the parser would find.
+        end = constants.RE_HEADER_SIMPLE.match(headerText).end()
+        if headerText.startswith(('\n', '\r\n'), end) or end == len(headerText):
+            self.__quickFields = {}
+            for match in constants.RE_HEADER_QUICK_FIELDS.finditer(headerText, 0, end):
+                self.__quickFields.setdefault(match.group(1).lower(), match.group(2).rstrip('\r\n'))
+
+    def __getattr__(self, name):
+        # Only called for attributes that are not set, which includes all of
+        # the parent's state until the header has been parsed. Don't parse if
+        # the instance hasn't been initialized, which can happen while it is
+        # being copied.
+        if self.__dict__.get('_LazyHeader__isParsed') is not False:
+            raise AttributeError(name)
+        self.__parse()
+        return getattr(self, name)
+
+    def __setitem__(self, name, val):
+        if self.__isParsed:
+            super().__setitem__(name, val)
+        else:
+            self.__added.append((name, val))
+
+    def __parse(self) -> None:
+        """
+        Runs the email parser on the header and takes on its state.
+        """
+        self.__dict__.update(vars(EmailParser().parsestr(self.__headerText)))
+        self.__isParsed = True
+        for name, value in self.__added:
+            self[name] = value
+        self.__added = []
+
+    def get(self, name, failobj = None):
+        if not self.__isParsed and self.__quickFields is not None:
+            key = name.lower()
+            if key in self.__quickFields:
+                return self.__quickFields[key]
+            # The header itself doesn't have the field, so the first one added
+            # afterwards is what the parser would return.
+            if key in constants.HEADER_QUICK_FIELD_NAMES:
+                return next((value for field, value in self.__added if field.lower() == key), failobj)
+        return super().get(name, failobj)
+
+
 class MessageBase(MSGFile):
     """
     Base class for Message like msg files.
@@ -39,10 +100,10 @@ class MessageBase(MSGFile):
             are doing.
         :param filename: optional, the filename to be used by default when
             saving.
-        :param delayAttachments: optional, delays the initialization of
-            attachments until the user attempts to retrieve them. Allows MSG
-            files with bad attachments to be initialized so the other data can
-            be retrieved.
+        :param delayAttachments: optional, prevents `preload` from
+            initializing the attachments, leaving that until the user attempts
+            to retrieve them. Allows MSG files with bad attachments to be
+            preloaded so the other data can be retrieved.
         :param overrideEncoding: optional, an encoding to use instead of the one
             specified by the msg file. Do not report encoding errors caused by
             this.
@@ -55,69 +116,44 @@ class MessageBase(MSGFile):
         self.__attachmentsDelayed = delayAttachments
         self.__attachmentsReady = False
         self.__recipientSeparator = recipientSeparator
-        # Initialize properties in the order that is least likely to cause bugs.
-        # TODO have each function check for initialization of needed data so these
-        # lines will be unnecessary.
-        self.mainProperties
-        self.header
-        self.recipients
-        if not delayAttachments:
-            self.attachments
-        self.to
-        self.cc
-        self.sender
-        self.date
         self.__crlf = '\n'  # This variable keeps track of what the new line character should be
-        self.body
-        self.named
+        self.__waitingProperties = []
+        # Most properties are only computed the first time they are requested.
+        # Use `preload` if you want them to be computed immediately.
 
     def _genRecipient(self, recipientType, recipientInt):
         """
         Returns the specified recipient field.
         """
-        private = '_' + recipientType
-        try:
-            return getattr(self, private)
-        except AttributeError:
-            value = None
-            # Check header first.
-            if self.headerInit():
-                value = self.header[recipientType]
-                if value:
-                    value = value.replace(',', self.__recipientSeparator)
-
-            # If the header had a blank field or didn't have the field, generate it manually.
-            if not value:
-                # Check if the header has initialized.
-                if self.headerInit():
-                    logger.info(f'Header found, but "{recipientType}" is not included. Will be generated from other streams.')
-
-                # Get a list of the recipients of the specified type.
-                foundRecipients = tuple(recipient.formatted for recipient in self.recipients if recipient.type & 0x0000000f == recipientInt)
-
-                # If we found recipients, join them with the recipient separator and a space.
-                if len(foundRecipients) > 0:
-                    value = (self.__recipientSeparator + ' ').join(foundRecipients)
-
-            # Code to fix the formatting so it's all a single line. This allows the user to format it themself if they want.
-            # This should probably be redone to use re or something, but I can do that later. This shouldn't be a huge problem for now.
+        # Check header first, if the message has one.
+        headerReady = bool(self._headerText)
+        value = None
+        if headerReady:
+            value = self.header[recipientType]
             if value:
-                value = value.replace(' \r\n\t', ' ').replace('\r\n\t ', ' ').replace('\r\n\t', ' ')
-                value = value.replace('\r\n', ' ').replace('\r', ' ').replace('\n', ' ')
-                while value.find('  ') != -1:
-                    value = value.replace('  ', ' ')
+                value = value.replace(',', self.__recipientSeparator)
+
+        # If the header had a blank field or didn't have the field, generate it manually.
+        if not value:
+            # Check if the header has initialized.
+            if headerReady:
+                logger.info(f'Header found, but "{recipientType}" is not included. Will be generated from other streams.')
 
-            # Set the field in the class.
-            setattr(self, private, value)
+            # Get a list of the recipients of the specified type.
+            foundRecipients = tuple(recipient.formatted for recipient in self._recipientsByType.get(recipientInt, ()))
 
-            return value
+            # If we found recipients, join them with the recipient separator and a space.
+            if len(foundRecipients) > 0:
+                value = (self.__recipientSeparator + ' ').join(foundRecipients)
+
+        # Unfold the field and collapse the whitespace so it's all a single line. This allows the user to format it themself if they want.
+        if value:
+            value = constants.RE_HEADER_WHITESPACE.sub(' ', value).strip()
+
+        return value
 
     def _registerNamedProperty(self, entry, _type, name = None):
-        if self.attachmentsDelayed and not self.attachmentsReady:
-            try:
-                self.__waitingProperties
-            except AttributeError:
-                self.__waitingProperties = []
+        if not self.attachmentsReady:
             self.__waitingProperties.append((entry, _type, name))
         else:
             for attachment in self.attachments:
@@ -126,25 +162,35 @@ class MessageBase(MSGFile):
         super()._registerNamedProperty(entry, _type, name)
 
     def close(self) -> None:
-        try:
-            # If this throws an AttributeError then we have not loaded the attachments.
-            self._attachments
+        # Only close the attachments if they have actually been loaded.
+        if self.attachmentsReady:
             for attachment in self.attachments:
                 if attachment.type == 'msg':
                     attachment.data.close()
-        except AttributeError:
-            pass
         super().close()
 
     def headerInit(self) -> bool:
         """
         Checks whether the header has been initialized.
         """
-        try:
-            self._header
-            return True
-        except AttributeError:
-            return False
+        return 'header' in self.__dict__
+
+    def preload(self) -> None:
+        """
+        Forces all of the lazily loaded data of the message to be parsed right
+        away instead of the first time it is requested.
+        """
+        self.mainProperties
+        self.header
+        self.recipients
+        if not self.attachmentsDelayed:
+            self.attachments
+        self.to
+        self.cc
+        self.sender
+        self.date
+        self.body
+        self.named
 
     def saveAttachments(self, **kwargs) -> None:
         """
@@ -153,53 +199,92 @@ class MessageBase(MSGFile):
         for attachment in self.attachments:
             attachment.save(**kwargs)
 
-    @property
+    @cachedProperty
+    def _dirIndex(self) -> dict:
+        """
+        A dictionary of the entries directly inside of the message, in the
+        order they were found, mapped to the full paths of everything under
+        them.
+        """
+        index = collections.defaultdict(list)
+        prefixLen = self.prefixLen
+        for dir_ in self.listDir(True, True):
+            index[dir_[prefixLen]].append(dir_)
+        # Return a plain dict so lookups of missing entries don't add them.
+        return dict(index)
+
+    @cachedProperty
+    def _headerText(self):
+        """
+        The raw header stream, if it exists. If it doesn't, the fields that
+        would be read from the header are read directly from the other streams.
+        """
+        return self._getStringStream('__substg1.0_007D')
+
+    @cachedProperty
+    def _recipientsByType(self) -> dict:
+        """
+        A dictionary of the recipients, in order, keyed by their type. See
+        `Recipient.type` for the meaning of each type.
+        """
+        index = collections.defaultdict(list)
+        for recipient in self.recipients:
+            index[recipient.type & 0x0000000f].append(recipient)
+        return dict(index)
+
+    @cachedProperty
+    def _rtfContentKind(self):
+        """
+        The kind of content encapsulated in the RTF body, either 'html' or
+        'text', found by checking the RTF header without deencapsulating it.
+        None if there is no RTF body or it is not encapsulated.
+        """
+        if not self.rtfBody:
+            return None
+        end = self.rtfBody.find(b'{', 1)
+        match = constants.RE_RTF_ENCAPSULATED_TYPE.search(self.rtfBody, 0, len(self.rtfBody) if end == -1 else end)
+        if match is None:
+            return None
+        return 'html' if match.group(1) == b'html1' else 'text'
+
+    @cachedProperty
     def attachments(self):
         """
         Returns a list of all attachments.
         """
-        try:
-            return self._attachments
-        except AttributeError:
-            # Get the attachments
-            attachmentDirs = []
-            prefixLen = self.prefixLen
-            for dir_ in self.listDir(False, True):
-                if dir_[prefixLen].startswith('__attach') and\
-                        dir_[prefixLen] not in attachmentDirs:
-                    attachmentDirs.append(dir_[prefixLen])
-
-            self._attachments = []
-
-            for attachmentDir in attachmentDirs:
-                try:
-                    self._attachments.append(self.attachmentClass(self, attachmentDir))
-                except (NotImplementedError, UnrecognizedMSGTypeError) as e:
-                    if self.attachmentErrorBehavior > constants.ATTACHMENT_ERROR_THROW:
-                        logger.error(f'Error processing attachment at {attachmentDir}')
-                        logger.exception(e)
-                        self._attachments.append(UnsupportedAttachment(self, attachmentDir))
-                    else:
-                        raise
-                except Exception as e:
-                    if self.attachmentErrorBehavior == constants.ATTACHMENT_ERROR_BROKEN:
-                        logger.error(f'Error processing attachment at {attachmentDir}')
-                        logger.exception(e)
-                        self._attachments.append(BrokenAttachment(self, attachmentDir))
-                    else:
-                        raise
-
-            self.__attachmentsReady = True
+        # The named properties of the attachments are only filled in when the
+        # main named properties are parsed, so make sure that has happened.
+        self.named
+
+        # Get the attachments
+        attachmentDirs = [dir_ for dir_ in self._dirIndex if dir_.startswith('__attach')]
+
+        attachments = []
+
+        for attachmentDir in attachmentDirs:
             try:
-                self.__waitingProperties
-                if self.__attachmentsDelayed:
-                    for attachment in self._attachments:
-                        for prop in self.__waitingProperties:
-                            attachment._registerNamedProperty(*prop)
-            except:
-                pass
+                attachments.append(self.attachmentClass(self, attachmentDir))
+            except (NotImplementedError, UnrecognizedMSGTypeError) as e:
+                if self.attachmentErrorBehavior > constants.ATTACHMENT_ERROR_THROW:
+                    logger.error(f'Error processing attachment at {attachmentDir}')
+                    logger.exception(e)
+                    attachments.append(UnsupportedAttachment(self, attachmentDir))
+                else:
+                    raise
+            except Exception as e:
+                if self.attachmentErrorBehavior == constants.ATTACHMENT_ERROR_BROKEN:
+                    logger.error(f'Error processing attachment at {attachmentDir}')
+                    logger.exception(e)
+                    attachments.append(BrokenAttachment(self, attachmentDir))
+                else:
+                    raise
+
+        self.__attachmentsReady = True
+        for attachment in attachments:
+            for prop in self.__waitingProperties:
+                attachment._registerNamedProperty(*prop)
 
-            return self._attachments
+        return attachments
 
     @property
     def attachmentsDelayed(self):
@@ -215,36 +300,30 @@ class MessageBase(MSGFile):
         """
         return self.__attachmentsReady
 
-    @property
+    @cachedProperty
     def bcc(self):
         """
         Returns the bcc field, if it exists.
         """
         return self._genRecipient('bcc', 3)
 
-    @property
+    @cachedProperty
     def body(self):
         """
         Returns the message body, if it exists.
         """
-        try:
-            return self._body
-        except AttributeError:
-            self._body = self._getStringStream('__substg1.0_1000')
-            if self._body:
-                self._body = inputToString(self._body, 'utf-8')
-                a = re.search('\n', self._body)
-                if a is not None:
-                    if re.search('\r\n', self._body) is not None:
-                        self.__crlf = '\r\n'
-            else:
-                # If the body doesn't exist, see if we can get it from the RTF
-                # body.
-                if self.deencapsulatedRtf and self.deencapsulatedRtf.content_type == 'text':
-                    self._body = self.deencapsulatedRtf.text
-            return self._body
+        body = self._getStringStream('__substg1.0_1000')
+        if body:
+            body = inputToString(body, 'utf-8')
+            self.__crlf = '\r\n' if '\r\n' in body else '\n'
+        else:
+            # If the body doesn't exist, see if we can get it from the RTF
+            # body. Only deencapsulate it if it actually contains text.
+            if self._rtfContentKind == 'text' and self.deencapsulatedRtf and self.deencapsulatedRtf.content_type == 'text':
+                body = self.deencapsulatedRtf.text
+        return body
 
-    @property
+    @cachedProperty
     def cc(self):
         """
         Returns the cc field, if it exists.
@@ -267,124 +346,104 @@ class MessageBase(MSGFile):
         self.body
         return self.__crlf
 
-    @property
+    @cachedProperty
     def date(self):
         """
         Returns the send date, if it exists.
         """
-        try:
-            return self._date
-        except AttributeError:
-            self._date = self._prop.date
-            return self._date
+        return self.mainProperties.date
 
-    @property
+    @cachedProperty
     def deencapsulatedRtf(self) -> RTFDE.DeEncapsulator:
         """
         Returns the instance of the deencapsulated RTF body.
         """
-        try:
-            return self._deencapsultor
-        except AttributeError:
-            if self.rtfBody:
-                # If there is an RTF body, we try to deencapsulate it.
-                try:
-                    self._deencapsultor = RTFDE.DeEncapsulator(self.rtfBody)
-                    self._deencapsultor.deencapsulate()
-                except RTFDE.exceptions.NotEncapsulatedRtf as e:
-                    logger.debug("RTF body is not encapsulated.")
-                    self._deencapsultor = None
-                except RTFDE.exceptions.MalformedEncapsulatedRtf as _e:
-                    logger.info("RTF body contains malformed encapsulated content.")
-                    self._deencapsultor = None
-            else:
-                self._deencapsultor = None
-            return self._deencapsultor
+        if self._rtfContentKind:
+            # If there is an encapsulated RTF body, we try to deencapsulate it.
+            try:
+                deencapsultor = RTFDE.DeEncapsulator(self.rtfBody)
+                deencapsultor.deencapsulate()
+            except RTFDE.exceptions.NotEncapsulatedRtf as e:
+                logger.debug("RTF body is not encapsulated.")
+                deencapsultor = None
+            except RTFDE.exceptions.MalformedEncapsulatedRtf as _e:
+                logger.info("RTF body contains malformed encapsulated content.")
+                deencapsultor = None
+        else:
+            deencapsultor = None
+        return deencapsultor
 
-    @property
+    @cachedProperty
     def defaultFolderName(self) -> str:
         """
         Generates the default name of the save folder.
         """
-        try:
-            return self._defaultFolderName
-        except AttributeError:
-            d = self.parsedDate
+        d = self.parsedDate
 
-            dirName = '{0:02d}-{1:02d}-{2:02d}_{3:02d}{4:02d}'.format(*d) if d else 'UnknownDate'
-            dirName += ' ' + (prepareFilename(self.subject) if self.subject else '[No subject]')
+        dirName = '{0:02d}-{1:02d}-{2:02d}_{3:02d}{4:02d}'.format(*d) if d else 'UnknownDate'
+        dirName += ' ' + (prepareFilename(self.subject) if self.subject else '[No subject]')
 
-            self._defaultFolderName = dirName
-            return dirName
+        return dirName
 
-    @property
-    def header(self):
+    @cachedProperty
+    def header(self) -> email.message.Message:
         """
         Returns the message header, if it exists. Otherwise it will generate
         one.
         """
-        try:
-            return self._header
-        except AttributeError:
-            headerText = self._getStringStream('__substg1.0_007D')
-            if headerText:
-                self._header = EmailParser().parsestr(headerText)
-                self._header['date'] = self.date
-            else:
-                logger.info('Header is empty or was not found. Header will be generated from other streams.')
-                header = EmailParser().parsestr('')
-                header.add_header('Date', self.date)
-                header.add_header('From', self.sender)
-                header.add_header('To', self.to)
-                header.add_header('Cc', self.cc)
-                header.add_header('Bcc', self.bcc)
-                header.add_header('Message-Id', self.messageId)
-                # TODO find authentication results outside of header
-                header.add_header('Authentication-Results', None)
-                self._header = header
-            return self._header
-
-    @property
+        if self._headerText:
+            # Only parse the header when something actually needs it.
+            header = _LazyHeader(self._headerText)
+            header['date'] = self.date
+        else:
+            logger.info('Header is empty or was not found. Header will be generated from other streams.')
+            header = EmailParser().parsestr('')
+            # Without a header stream, the fields below come straight from the
+            # other streams and never look at the header.
+            header.add_header('Date', self.date)
+            header.add_header('From', self.sender)
+            header.add_header('To', self.to)
+            header.add_header('Cc', self.cc)
+            header.add_header('Bcc', self.bcc)
+            header.add_header('Message-Id', self.messageId)
+            # TODO find authentication results outside of header
+            header.add_header('Authentication-Results', None)
+        return header
+
+    @cachedProperty
     def headerDict(self) -> dict:
         """
-        Returns a dictionary of the entries in the header
+        Returns a dictionary of the entries in the header. The Received entries
+        are left out as there are usually several of them, use
+        `receivedHeaders` to get those.
         """
-        try:
-            return self._headerDict
-        except AttributeError:
-            self._headerDict = dict(self.header._headers)
-            try:
-                self._headerDict.pop('Received')
-            except KeyError:
-                pass
-            return self._headerDict
+        return {key: value for key, value in self.header._headers if key.lower() != 'received'}
 
-    @property
+    @cachedProperty
     def htmlBody(self) -> bytes:
         """
         Returns the html body, if it exists.
         """
-        try:
-            return self._htmlBody
-        except AttributeError:
-            if self._ensureSet('_htmlBody', '__substg1.0_10130102', False):
-                # Reducing line repetition.
-                pass
-            elif self.rtfBody:
-                logger.info('HTML body was not found, attempting to generate from RTF.')
-                if self.deencapsulatedRtf and self.deencapsulatedRtf.content_type == 'html':
-                    self._htmlBody = self.deencapsulatedRtf.html.encode('utf-8')
-                else:
-                    logger.info('Could not deencapsulate HTML from RTF body.')
-            elif self.body:
-                # Convert the plain text body to html.
-                logger.info('HTML body was not found, attempting to generate from plain text body.')
-                correctedBody = self.body.encode('utf-8').replace('\r', '').replace('\n', '</br>')
-                self._htmlBody = f'<html><body>{correctedBody}</body></head>'
+        htmlBody = self._getStream('__substg1.0_10130102')
+        if htmlBody:
+            # Reducing line repetition.
+            pass
+        elif self.rtfBody:
+            logger.info('HTML body was not found, attempting to generate from RTF.')
+            if self._rtfContentKind == 'html' and self.deencapsulatedRtf and self.deencapsulatedRtf.content_type == 'html':
+                # Newer versions of RTFDE give bytes instead of a string.
+                htmlBody = inputToBytes(self.deencapsulatedRtf.html, 'utf-8')
             else:
-                logger.into('HTML body could not be found nor generated.')
+                logger.info('Could not deencapsulate HTML from RTF body.')
+        elif self.body:
+            # Convert the plain text body to html.
+            logger.info('HTML body was not found, attempting to generate from plain text body.')
+            correctedBody = self.body.encode('utf-8').translate(None, b'\r').replace(b'\n', b'</br>')
+            htmlBody = b'<html><body>' + correctedBody + b'</body></html>'
+        else:
+            logger.info('HTML body could not be found nor generated.')
 
-            return self._htmlBody
+        return htmlBody
 
     @property
     def htmlBodyPrepared(self) -> bytes:
@@ -396,21 +455,39 @@ class MessageBase(MSGFile):
         if not self.htmlBody:
             return self.htmlBody
 
+        # If nothing references an attachment by its content id, there is
+        # nothing to inject so we can skip parsing the body entirely.
+        if b'cid:' not in self.htmlBody:
+            return self.htmlBody
+
         # Create the BeautifulSoup instance to use.
         soup = bs4.BeautifulSoup(self.htmlBody, 'html.parser')
 
         # Get a list of image tags to see if we can inject into. If the source
         # of an image starts with "cid:" that means it is one of the attachments
         # and is using the content id of that attachment.
-        tags = (tag for tag in soup.findAll('img') if tag.get('src') and tag.get('src').startswith('cid:'))
+        tags = soup.select('img[src^="cid:"]')
 
+        # Map the content ids to their attachments so each tag only needs a
+        # single lookup. If several attachments share an id, the first wins.
+        cidMap = {}
+        for attachment in self.attachments:
+            cid = getattr(attachment, 'cid', None)
+            if cid:
+                cidMap.setdefault(cid, attachment)
+
+        # Each content id is only encoded once, even if several tags use it.
+        sources = {}
         for tag in tags:
-            # Iterate through the attachments until we get the right one.
             cid = tag['src'][4:]
-            data = next((attachment.data for attachment in self.attachments if attachment.cid == cid), None)
+            if cid not in sources:
+                attachment = cidMap.get(cid)
+                # Only the data of matched attachments is ever loaded.
+                data = attachment.data if attachment else None
+                sources[cid] = f'data:image;base64,{base64.b64encode(data).decode("ascii")}' if data else None
             # If we found anything, inject it.
-            if data:
-                tag['src'] = (b'data:image;base64,' + base64.b64encode(data)).decode('utf-8')
+            if sources[cid]:
+                tag['src'] = sources[cid]
 
         return soup.prettify('utf-8')
 
@@ -428,93 +505,84 @@ class MessageBase(MSGFile):
         """
         return bool(self.mainProperties['0E070003'].value & 1)
 
-    @property
+    @cachedProperty
     def messageId(self):
-        try:
-            return self._messageId
-        except AttributeError:
-            headerResult = None
-            if self.headerInit():
-                headerResult = self._header['message-id']
+        if self._headerText:
+            headerResult = self.header['message-id']
             if headerResult is not None:
-                self._messageId = headerResult
-            else:
-                if self.headerInit():
-                    logger.info('Header found, but "Message-Id" is not included. Will be generated from other streams.')
-                self._messageId = self._getStringStream('__substg1.0_1035')
-            return self._messageId
+                return headerResult
+            logger.info('Header found, but "Message-Id" is not included. Will be generated from other streams.')
+        return self._getStringStream('__substg1.0_1035')
 
-    @property
+    @cachedProperty
     def parsedDate(self):
-        return email.utils.parsedate(self.date)
+        """
+        Returns the date of the message as a time tuple, if it exists.
+        """
+        return email.utils.parsedate(self.date) if self.date else None
+
+    @cachedProperty
+    def parsedReceived(self) -> list:
+        """
+        Returns a list of dictionaries with the parsed clauses of each Received
+        entry in the header, in the same order as `receivedHeaders`. See
+        `utils.parseReceived` for the format.
+        """
+        return [parseReceived(received) for received in self.receivedHeaders]
+
+    @cachedProperty
+    def receivedHeaders(self) -> list:
+        """
+        Returns a list of the Received entries in the header, in the order they
+        appear.
+        """
+        return [value for key, value in self.header._headers if key.lower() == 'received']
 
     @property
     def recipientSeparator(self) -> str:
         return self.__recipientSeparator
 
-    @property
+    @cachedProperty
     def recipients(self) -> list:
         """
         Returns a list of all recipients.
         """
-        try:
-            return self._recipients
-        except AttributeError:
-            # Get the recipients
-            recipientDirs = []
-            prefixLen = self.prefixLen
-            for dir_ in self.listDir():
-                if dir_[prefixLen].startswith('__recip') and\
-                        dir_[prefixLen] not in recipientDirs:
-                    recipientDirs.append(dir_[prefixLen])
-
-            self._recipients = []
-
-            for recipientDir in recipientDirs:
-                self._recipients.append(Recipient(recipientDir, self))
+        # Get the recipients
+        recipientDirs = [dir_ for dir_ in self._dirIndex if dir_.startswith('__recip')]
 
-            return self._recipients
+        return [Recipient(recipientDir, self) for recipientDir in recipientDirs]
 
-    @property
+    @cachedProperty
     def rtfBody(self) -> bytes:
         """
         Returns the decompressed Rtf body from the message.
         """
-        try:
-            return self._rtfBody
-        except AttributeError:
-            self._rtfBody = compressed_rtf.decompress(self.compressedRtf) if self.compressedRtf else None
-            return self._rtfBody
+        return compressed_rtf.decompress(self.compressedRtf) if self.compressedRtf else None
 
-    @property
+    @cachedProperty
     def sender(self) -> str:
         """
         Returns the message sender, if it exists.
         """
-        try:
-            return self._sender
-        except AttributeError:
-            # Check header first
-            if self.headerInit():
-                headerResult = self.header['from']
-                if headerResult is not None:
-                    self._sender = headerResult
-                    return headerResult
-                logger.info('Header found, but "sender" is not included. Will be generated from other streams.')
-            # Extract from other fields
-            text = self._getStringStream('__substg1.0_0C1A')
-            email = self._getStringStream('__substg1.0_5D01')
-            # Will not give an email address sometimes. Seems to exclude the email address if YOU are the sender.
-            result = None
-            if text is None:
-                result = email
-            else:
-                result = text
-                if email is not None:
-                    result += ' <' + email + '>'
+        # Check header first, if the message has one.
+        if self._headerText:
+            headerResult = self.header['from']
+            if headerResult is not None:
+                return headerResult
+            logger.info('Header found, but "sender" is not included. Will be generated from other streams.')
+        # Extract from other fields
+        text = self._getStringStream('__substg1.0_0C1A')
+        email = self._getStringStream('__substg1.0_5D01')
+        # Will not give an email address sometimes. Seems to exclude the email address if YOU are the sender.
+        result = None
+        if text is None:
+            result = email
+        else:
+            result = text
+            if email is not None:
+                result += ' <' + email + '>'
 
-            self._sender = result
-            return result
+        return result
 
     @property
     def subject(self):
@@ -523,7 +591,7 @@ class MessageBase(MSGFile):
         """
         return self._ensureSet('_subject', '__substg1.0_0037')
 
-    @property
+    @cachedProperty
     def to(self):
         """
         Returns the to field, if it exists.
@@ -50,6 +50,7 @@ class MSGFile(olefile.OleFileIO):
             logger.warning('You have chosen to override the string encoding. Do not report encoding errors caused by this.')
             self.__stringEncoding = overrideEncoding
         self.__overrideEncoding = overrideEncoding
+        self.__listDirRes = {}
 
         try:
             super().__init__(path)
@@ -352,22 +353,23 @@ class MSGFile(olefile.OleFileIO):
     def listDir(self, streams : bool = True, storages : bool = False):
         """
         Replacement for OleFileIO.listdir that runs at the current prefix
-        directory.
+        directory. The returned list is cached, so it should not be modified.
         """
-        # Get the items from OleFileIO.
+        # Get the items from OleFileIO. The results are cached for each
+        # combination of arguments since the directory never changes.
         try:
-            return self.__listDirRes
-        except AttributeError:
+            return self.__listDirRes[(streams, storages)]
+        except KeyError:
             entries = self.listdir(streams, storages)
-            if not self.__prefix:
-                return entries
-            prefix = self.__prefix.split('/')
-            if prefix[-1] == '':
-                prefix.pop()
-
-            prefixLength = self.__prefixLen
-            self.__listDirRes = [x for x in entries if len(x) > prefixLength and x[:prefixLength] == prefix]
-            return self.__listDirRes
+            if self.__prefix:
+                prefix = self.__prefix.split('/')
+                if prefix[-1] == '':
+                    prefix.pop()
+
+                prefixLength = self.__prefixLen
+                entries = [x for x in entries if len(x) > prefixLength and x[:prefixLength] == prefix]
+            self.__listDirRes[(streams, storages)] = entries
+            return entries
 
     def slistDir(self, streams : bool = True, storages : bool = False):
         """
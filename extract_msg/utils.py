@@ -6,6 +6,7 @@ import argparse
 import codecs
 import copy
 import datetime
+import ipaddress
 import json
 import logging
 import logging.config
@@ -90,6 +91,31 @@ def bytesToGuid(bytesInput : bytes) -> str:
     guidVals = constants.ST_GUID.unpack(bytesInput)
     return f'{{{guidVals[0]:08X}-{guidVals[1]:04X}-{guidVals[2]:04X}-{guidVals[3][:2].hex().upper()}-{guidVals[3][2:].hex().upper()}}}'
 
+class cachedProperty:
+    """
+    Decorator that turns a method into a property which is computed the first
+    time it is requested and then stored in the instance's __dict__, where it
+    will be found before the property.
+
+    Unlike `functools.cached_property` before Python 3.12, this does not hold a
+    lock that is shared by every instance of the class. If two threads request
+    the property at the same time, it may be computed twice, but they will never
+    wait on each other.
+    """
+    def __init__(self, func):
+        self.func = func
+        self.name = func.__name__
+        self.__doc__ = func.__doc__
+
+    def __set_name__(self, owner, name):
+        self.name = name
+
+    def __get__(self, instance, owner = None):
+        if instance is None:
+            return self
+        value = instance.__dict__[self.name] = self.func(instance)
+        return value
+
 def ceilDiv(n : int, d : int) -> int:
     """
     Returns the int from the ceil division of n / d.
@@ -621,6 +647,51 @@ def openMsg(path, prefix = '', attachmentClass = None, filename = None, delayAtt
         logger.error(f'Could not recognize msg class type "{msg.classType}". This most likely means it hasn\'t been implemented yet, and you should ask the developers to add support for it.')
         return msg
 
+def parseReceived(received : str) -> dict:
+    """
+    Parses the value of a Received header field into a dictionary of its
+    clauses. The keys are the clause keywords that were found ('from', 'by',
+    'via', 'with', 'id', and 'for') along with 'date' for the date at the end
+    and 'ip' for the address of the sending host, if a valid one was found.
+
+    This is done in a single scan over the keywords, skipping any that are
+    inside of comments.
+    """
+    # The date comes after the last semicolon.
+    clauses, sep, date = received.rpartition(';')
+    if not sep:
+        clauses, date = received, None
+
+    # Track the parenthesis depth between keywords so the ones inside of
+    # comments can be skipped.
+    keywords = []
+    depth = 0
+    position = 0
+    for match in constants.RE_RECEIVED_KEYWORDS.finditer(clauses):
+        depth += clauses.count('(', position, match.start()) - clauses.count(')', position, match.start())
+        position = match.start()
+        if depth <= 0:
+            keywords.append(match)
+
+    parsed = {}
+    for index, match in enumerate(keywords):
+        end = keywords[index + 1].start() if index + 1 < len(keywords) else len(clauses)
+        value = constants.RE_HEADER_WHITESPACE.sub(' ', clauses[match.end():end]).strip()
+        parsed.setdefault(match.group(1).lower(), value)
+
+    if date is not None:
+        parsed['date'] = constants.RE_HEADER_WHITESPACE.sub(' ', date).strip()
+
+    parsed['ip'] = None
+    for candidate in constants.RE_RECEIVED_IP.findall(parsed.get('from', '')):
+        try:
+            parsed['ip'] = str(ipaddress.ip_address(candidate))
+            break
+        except ValueError:
+            pass
+
+    return parsed
+
 def parseType(_type : int, stream, encoding, extras):
     """
     Converts the data in :param stream: to a much more accurate type, specified
@@ -1,10 +1,16 @@
+import email.message
 import shutil
 import os
+import threading
 import unittest
 
+from email.parser import Parser as EmailParser
+
 import extract_msg
 
 TEST_FILE = "example-msg-files/unicode.msg"
+# Has no header stream, so its header is generated from the other streams.
+NO_HEADER_FILE = "example-msg-files/strangeDate.msg"
 
 
 class TestCase(unittest.TestCase):
@@ -34,6 +40,70 @@ class TestCase(unittest.TestCase):
         msg.dump()
         msg.debug()
 
+    def test_header(self):
+        msg = extract_msg.Message(TEST_FILE)
+        self.assertEqual(len(msg.receivedHeaders), 4)
+        self.assertNotIn('Received', msg.headerDict)
+        self.assertEqual(msg.parsedReceived[1]['from'], 'mail-vc0-f182.google.com ([209.85.220.182])')
+        self.assertEqual(msg.parsedReceived[1]['ip'], '209.85.220.182')
+        self.assertEqual(msg.headerDict['Subject'], 'Test for TIF files')
+
+    def test_headerQuickFields(self):
+        msg = extract_msg.Message(TEST_FILE)
+        parsed = EmailParser().parsestr(msg._headerText)
+        for name in ('from', 'to', 'cc', 'bcc', 'date', 'subject', 'message-id'):
+            self.assertEqual(msg.header[name], parsed[name])
+        # None of the fields above should have needed the full parse.
+        self.assertNotIn('_headers', vars(msg.header))
+        self.assertIsInstance(msg.header, email.message.Message)
+        self.assertEqual(msg.header.get_all('received'), parsed.get_all('received'))
+        del msg.header['subject']
+        self.assertIsNone(msg.header['subject'])
+
+    def test_headerThreads(self):
+        # Generating a header reads the fields, while reading a field from a
+        # message with a header reads the header. Doing both at once on
+        # different messages must not make the threads wait on each other.
+        for _ in range(20):
+            generated = extract_msg.Message(NO_HEADER_FILE)
+            parsed = extract_msg.Message(TEST_FILE)
+            barrier = threading.Barrier(2)
+            def getHeader():
+                barrier.wait()
+                generated.header
+            def getFields():
+                barrier.wait()
+                parsed.to
+                parsed.sender
+                parsed.messageId
+            # Daemon threads so a deadlock fails the test instead of hanging it.
+            threads = [threading.Thread(target = getHeader, daemon = True), threading.Thread(target = getFields, daemon = True)]
+            for thread in threads:
+                thread.start()
+            for thread in threads:
+                thread.join(5)
+                self.assertFalse(thread.is_alive())
+            self.assertEqual(generated.header['to'], generated.to)
+            self.assertEqual(parsed.to, 'brianzhou@me.com')
+            generated.close()
+            parsed.close()
+
+    def test_htmlBody(self):
+        msg = extract_msg.Message(TEST_FILE)
+        self.assertIsInstance(msg.htmlBody, bytes)
+        self.assertIn(b'This is a test email', msg.htmlBody)
+
+    def test_htmlBodyFromPlainText(self):
+        msg = extract_msg.Message(TEST_FILE)
+        # The test file has no HTML body, so hiding the RTF body forces the
+        # generation from the plain text body.
+        msg.rtfBody = None
+        self.assertIsInstance(msg.htmlBody, bytes)
+        self.assertTrue(msg.htmlBody.startswith(b'<html><body>'))
+        self.assertTrue(msg.htmlBody.endswith(b'</body></html>'))
+        self.assertNotIn(b'\r', msg.htmlBody)
+        self.assertIn(b'MSG Extractor</br></br></br>-- </br>', msg.htmlBody)
+
     def test_save(self):
         msg = extract_msg.Message(TEST_FILE)
         msg.save()